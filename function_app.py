@@ -1,35 +1,181 @@
-import base64
-import json
+import asyncio
+import binascii
+import functools
+import hashlib
 import logging
 import os
+import re
+import secrets
+import struct
+import threading
+from typing import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterator
+from urllib.parse import urlencode
+from xml.sax.saxutils import escape, quoteattr
 
-import azure.cognitiveservices.speech as speechsdk
 import azure.functions as func
-import requests
-from dotenv import load_dotenv
+import httpx
+import orjson
+from cachetools import LRUCache
 
 
-load_dotenv(override=True)
+# .env files are a local-development convenience only
+if os.getenv("AZURE_FUNCTIONS_ENVIRONMENT") != "Production":
+    from dotenv import load_dotenv
+
+    load_dotenv(override=True)
 
 app = func.FunctionApp()
+logger = logging.getLogger(__name__)
+
+_SPEECH_KEY = os.getenv("AZURE_SPEECH_KEY") or os.getenv("AZURE_SPEECH_API_KEY")
+_SPEECH_REGION = os.getenv("AZURE_SPEECH_REGION") or os.getenv("AZURE_SPEECH_LOCATION")
+
+# Shared async HTTP/2 client so warm invocations reuse (and multiplex over) keep-alive
+# connections to Speech and Translator without tying up a worker thread per request
+_HTTPX = httpx.AsyncClient(
+    transport=httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+    ),
+    timeout=10.0,
+)
+# Concurrent STT uploads per request, so one request's segments cannot fan out unbounded
+_STT_SEGMENT_CONCURRENCY = 4
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_RETRIES = 2
+_RETRY_BACKOFF = 0.2
+
+# Short-audio (<= 60 s) recognition endpoint; shares the pooled client with Translator
+_STT_URL_TEMPLATE = (
+    "https://{region}.stt.speech.microsoft.com"
+    "/speech/recognition/conversation/cognitiveservices/v1"
+)
+_STT_HEADERS = {
+    "Ocp-Apim-Subscription-Key": _SPEECH_KEY or "",
+    "Content-Type": "audio/wav; codecs=audio/pcm; samplerate=16000",
+    "Accept": "application/json",
+}
+
+# Synthesis endpoint; returns the whole WAV in one response over the same pooled client
+_TTS_URL_TEMPLATE = "https://{region}.tts.speech.microsoft.com/cognitiveservices/v1"
+_TTS_HEADERS = {
+    "Ocp-Apim-Subscription-Key": _SPEECH_KEY or "",
+    "Content-Type": "application/ssml+xml",
+    "X-Microsoft-OutputFormat": "riff-16khz-16bit-mono-pcm",
+    "User-Agent": "speech-translation-function",
+}
+
+_raw_translator_endpoint = (
+    os.getenv("AZURE_TRANSLATE_ENDPOINT")
+    or os.getenv("AZURE_TRANSLATOR_ENDPOINT")
+    or os.getenv("AZURE_TRANSLATOR_URL")
+)
+_TRANSLATOR_ENDPOINT = _raw_translator_endpoint.rstrip("/") if _raw_translator_endpoint else None
+_TRANSLATOR_KEY = os.getenv("AZURE_TRANSLATE_KEY") or os.getenv("AZURE_TRANSLATOR_KEY")
+_TRANSLATOR_REGION = (
+    os.getenv("AZURE_TRANSLATE_REGION")
+    or os.getenv("AZURE_TRANSLATOR_REGION")
+    or os.getenv("AZURE_TRANSLATOR_LOCATION")
+    or ""
+).strip()
+
+# Azure Translator per-request limits
+_TRANSLATOR_MAX_ITEMS = 100
+_TRANSLATOR_MAX_CHARS = 10_000
+
+# Static Translator headers, built once per worker instead of per request
+_TRANSLATOR_HEADERS = {
+    "Ocp-Apim-Subscription-Key": _TRANSLATOR_KEY or "",
+    "Content-Type": "application/json",
+    "Accept-Encoding": "gzip, deflate",
+}
+if _TRANSLATOR_REGION:
+    _TRANSLATOR_HEADERS["Ocp-Apim-Subscription-Region"] = _TRANSLATOR_REGION
+
+# Azure Speech locales accepted at the edge; requests for anything else fail fast
+_VALID_LOCALES = frozenset({
+    "af-ZA", "am-ET", "ar-AE", "ar-BH", "ar-DZ", "ar-EG", "ar-IL", "ar-IQ", "ar-JO",
+    "ar-KW", "ar-LB", "ar-LY", "ar-MA", "ar-OM", "ar-PS", "ar-QA", "ar-SA", "ar-SY",
+    "ar-TN", "ar-YE", "as-IN", "az-AZ", "bg-BG", "bn-IN", "bs-BA", "ca-ES", "cs-CZ",
+    "cy-GB", "da-DK", "de-AT", "de-CH", "de-DE", "el-GR", "en-AU", "en-CA", "en-GB",
+    "en-GH", "en-HK", "en-IE", "en-IN", "en-KE", "en-NG", "en-NZ", "en-PH", "en-SG",
+    "en-TZ", "en-US", "en-ZA", "es-AR", "es-BO", "es-CL", "es-CO", "es-CR", "es-CU",
+    "es-DO", "es-EC", "es-ES", "es-GQ", "es-GT", "es-HN", "es-MX", "es-NI", "es-PA",
+    "es-PE", "es-PR", "es-PY", "es-SV", "es-US", "es-UY", "es-VE", "et-EE", "eu-ES",
+    "fa-IR", "fi-FI", "fil-PH", "fr-BE", "fr-CA", "fr-CH", "fr-FR", "ga-IE", "gl-ES",
+    "gu-IN", "he-IL", "hi-IN", "hr-HR", "hu-HU", "hy-AM", "id-ID", "is-IS", "it-CH",
+    "it-IT", "ja-JP", "jv-ID", "ka-GE", "kk-KZ", "km-KH", "kn-IN", "ko-KR", "lo-LA",
+    "lt-LT", "lv-LV", "mk-MK", "ml-IN", "mn-MN", "mr-IN", "ms-MY", "mt-MT", "my-MM",
+    "nb-NO", "ne-NP", "nl-BE", "nl-NL", "or-IN", "pa-IN", "pl-PL", "ps-AF", "pt-BR",
+    "pt-PT", "ro-RO", "ru-RU", "si-LK", "sk-SK", "sl-SI", "so-SO", "sq-AL", "sr-RS",
+    "sv-SE", "sw-KE", "sw-TZ", "ta-IN", "te-IN", "th-TH", "tr-TR", "uk-UA", "ur-IN",
+    "uz-UZ", "vi-VN", "yue-CN", "zh-CN", "zh-HK", "zh-TW", "zu-ZA",
+})
+_LOCALES_BY_LOWER = {locale.lower(): locale for locale in _VALID_LOCALES}
+# Locales whose Translator code is not just the language subtag (script or regional variants)
+_TRANSLATOR_LANGUAGE_CODES = {
+    "zh-CN": "zh-Hans",
+    "zh-TW": "zh-Hant",
+    "zh-HK": "zh-Hant",
+    "sr-RS": "sr-Cyrl",
+    "mn-MN": "mn-Cyrl",
+    "pt-PT": "pt-PT",
+    "fr-CA": "fr-CA",
+}
+
+# Upper bound on total base64 audio per request (~11 MiB of decoded audio)
+_MAX_AUDIO_B64_LEN = 15 * 1024 * 1024
+_WAV_HEADER_SIZE = 44
+# b"RIFF" read as a little-endian uint32, so the header check needs no slice
+_RIFF_MAGIC_LE = 0x46464952
+# Unwrapped standard base64: alphabet characters with at most two trailing "=" pads
+_BASE64_RE = re.compile(r"[A-Za-z0-9+/]*={0,2}")
+# 32 KiB of base64 text (a multiple of 4) decodes to 24 KiB of audio per block
+_B64_READ_CHUNK = 32 * 1024
+
+# Exact-match caches: full pipeline output keyed on audio digest, and translated
+# text keyed on transcript so different recordings of the same phrase still hit
+_CACHE_LOCK = threading.Lock()
+_AUDIO_DIGEST_KEY = secrets.token_bytes(32)
+# The audio cache holds whole WAV responses, so it is bounded by bytes, not entries
+_AUDIO_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_AUDIO_CACHE: LRUCache = LRUCache(maxsize=_AUDIO_CACHE_MAX_BYTES, getsizeof=len)
+_TRANSLATION_CACHE: LRUCache = LRUCache(maxsize=512)
+
+
+def _cache_get(cache: LRUCache, key):
+    with _CACHE_LOCK:
+        return cache.get(key)
+
+
+def _cache_put(cache: LRUCache, key, value) -> None:
+    with _CACHE_LOCK:
+        try:
+            cache[key] = value
+        except ValueError:
+            # Larger than the whole size budget; just don't cache it
+            pass
 
 
 @app.route(route="translate", methods=["POST"], auth_level=func.AuthLevel.ANONYMOUS)
-def translate(req: func.HttpRequest) -> func.HttpResponse:
+async def translate(req: func.HttpRequest) -> func.HttpResponse:
     """
     HTTP Trigger: Receives audio + translation config, returns translated audio
     Pipeline: STT (Azure Speech) -> Translate (Azure Translator) -> TTS (Azure Speech)
     """
 
-    logging.info("Translation request received")
+    logger.info("Translation request received")
     current_stage = "parse_request"
 
     try:
-        req_body = req.get_json()
+        req_body = orjson.loads(req.get_body())
+        if not isinstance(req_body, dict):
+            raise ValueError("JSON payload must be an object")
     except ValueError:
-        logging.exception("Invalid JSON payload")
+        logger.exception("Invalid JSON payload")
         return func.HttpResponse(
-            json.dumps({"error": "Invalid JSON payload"}),
+            orjson.dumps({"error": "Invalid JSON payload"}),
             status_code=400,
             mimetype="application/json",
         )
@@ -37,54 +183,130 @@ def translate(req: func.HttpRequest) -> func.HttpResponse:
     source_locale = req_body.get("source_locale")
     target_locale = req_body.get("target_locale")
     neural_voice = req_body.get("neural_voice")
-    audio_data_b64 = req_body.get("audio_data")
+    audio_segments_b64 = req_body.get("audio_segments")
+    if audio_segments_b64 is None and req_body.get("audio_data"):
+        audio_segments_b64 = [req_body.get("audio_data")]
+
+    if not all([source_locale, target_locale, neural_voice, audio_segments_b64]):
+        logger.warning("Missing required fields in request body")
+        return func.HttpResponse(
+            orjson.dumps({"error": "Missing required fields"}),
+            status_code=400,
+            mimetype="application/json",
+        )
+
+    if not isinstance(audio_segments_b64, list) or not all(
+        isinstance(segment, str) for segment in audio_segments_b64
+    ):
+        logger.warning("Invalid audio data in request body")
+        return func.HttpResponse(
+            orjson.dumps(
+                {"error": "Invalid audio data: expected base64 string(s)", "stage": "decode_audio"}
+            ),
+            status_code=400,
+            mimetype="application/json",
+        )
+
+    if not isinstance(neural_voice, str):
+        logger.warning("Invalid neural_voice in request body")
+        return func.HttpResponse(
+            orjson.dumps({"error": "neural_voice must be a string"}),
+            status_code=400,
+            mimetype="application/json",
+        )
+
+    source_locale = _normalize_locale(source_locale)
+    target_locale = _normalize_locale(target_locale)
+    if not source_locale or not target_locale:
+        logger.warning("Unsupported locale in request body")
+        return func.HttpResponse(
+            orjson.dumps({"error": "Unsupported source_locale or target_locale"}),
+            status_code=400,
+            mimetype="application/json",
+        )
 
-    if not all([source_locale, target_locale, neural_voice, audio_data_b64]):
-        logging.warning("Missing required fields in request body")
+    if len(audio_segments_b64) > _TRANSLATOR_MAX_ITEMS:
+        logger.warning("Too many audio segments: %d", len(audio_segments_b64))
         return func.HttpResponse(
-            json.dumps({"error": "Missing required fields"}),
+            orjson.dumps(
+                {"error": f"At most {_TRANSLATOR_MAX_ITEMS} audio segments are allowed"}
+            ),
             status_code=400,
             mimetype="application/json",
         )
 
-    logging.info(
-        "Processing request: %s -> %s, voice: %s",
+    audio_b64_len = sum(len(segment) for segment in audio_segments_b64)
+    if audio_b64_len > _MAX_AUDIO_B64_LEN:
+        logger.warning("Audio payload too large: %d base64 chars", audio_b64_len)
+        return func.HttpResponse(
+            orjson.dumps(
+                {"error": f"Audio payload exceeds {_MAX_AUDIO_B64_LEN} base64 characters"}
+            ),
+            status_code=413,
+            mimetype="application/json",
+        )
+
+    logger.info(
+        "Processing request: %s -> %s, voice: %s, segments: %d",
         source_locale,
         target_locale,
         neural_voice,
+        len(audio_segments_b64),
     )
 
+    # Audio is decoded lazily while it is uploaded to STT, so it must be fully validated
+    # here: a decode error halfway through an upload cannot be reported cleanly
     current_stage = "decode_audio"
-    try:
-        audio_bytes = base64.b64decode(audio_data_b64)
-    except (ValueError, TypeError) as exc:
-        logging.exception("Failed to decode audio data at stage %s", current_stage)
+    audio_segments_b64 = [_clean_base64(segment) for segment in audio_segments_b64]
+    if not all(audio_segments_b64):
+        logger.warning("Invalid audio data at stage %s", current_stage)
         return func.HttpResponse(
-            json.dumps({"error": f"Invalid audio data: {exc}", "stage": current_stage}),
+            orjson.dumps(
+                {"error": "Invalid audio data: expected base64 string(s)", "stage": current_stage}
+            ),
             status_code=400,
             mimetype="application/json",
         )
 
-    logging.info("Stage %s complete: %d bytes decoded", current_stage, len(audio_bytes))
+    logger.info("Stage %s complete: %d base64 chars received", current_stage, audio_b64_len)
+
+    audio_key = (source_locale, target_locale, neural_voice, _audio_digest(audio_segments_b64))
+    translated_audio = _cache_get(_AUDIO_CACHE, audio_key)
+    if translated_audio is not None:
+        logger.info("Response cache hit, skipping pipeline")
+        return func.HttpResponse(
+            body=translated_audio,
+            status_code=200,
+            mimetype="audio/wav",
+        )
 
     try:
         current_stage = "speech_to_text"
-        transcribed_text = speech_to_text(audio_bytes, source_locale)
-        logging.info("Stage %s output: %s", current_stage, transcribed_text)
+        stt = _make_stt_caller(source_locale)
+        transcripts = await _recognize_segments(stt, audio_segments_b64)
+        logger.debug("Stage %s output: %s", current_stage, transcripts)
+
+        # Nothing was said: skip Translator and TTS entirely
+        transcripts = [text for text in transcripts if text.strip()]
+        if not transcripts:
+            logger.info("No speech recognized, returning empty response")
+            return func.HttpResponse(status_code=204)
 
         current_stage = "translate_text"
-        translated_text = translate_text(
-            transcribed_text, source_locale, target_locale
+        translated_text = " ".join(
+            await _translate_transcripts(transcripts, source_locale, target_locale)
         )
-        logging.info("Stage %s output: %s", current_stage, translated_text)
+        logger.debug("Stage %s output: %s", current_stage, translated_text)
 
         current_stage = "text_to_speech"
-        translated_audio = text_to_speech(translated_text, target_locale, neural_voice)
-        logging.info("Stage %s complete: %d bytes generated", current_stage, len(translated_audio))
+        tts = _make_tts_caller(target_locale, neural_voice)
+        translated_audio = await tts(translated_text)
+        logger.info("Stage %s complete: %d bytes generated", current_stage, len(translated_audio))
+        _cache_put(_AUDIO_CACHE, audio_key, translated_audio)
     except Exception as exc:  # pylint: disable=broad-except
-        logging.exception("Processing pipeline failed at stage %s", current_stage)
+        logger.exception("Processing pipeline failed at stage %s", current_stage)
         return func.HttpResponse(
-            json.dumps({"error": str(exc), "stage": current_stage}),
+            orjson.dumps({"error": str(exc), "stage": current_stage}),
             status_code=500,
             mimetype="application/json",
         )
@@ -96,160 +318,375 @@ def translate(req: func.HttpRequest) -> func.HttpResponse:
     )
 
 
-def speech_to_text(audio_bytes: bytes, locale: str) -> str:
-    """Convert audio to text using Azure Speech Service using the provided locale."""
+def _normalize_locale(locale) -> str | None:
+    """Return the canonical spelling of a supported locale (case-insensitive), else None."""
+
+    if not isinstance(locale, str):
+        return None
+    return _LOCALES_BY_LOWER.get(locale.lower())
+
+
+@functools.lru_cache(maxsize=128)
+def _lang(locale: str) -> str:
+    """Translator language code of a locale, e.g. "en-US" -> "en", "zh-TW" -> "zh-Hant"."""
+
+    return _TRANSLATOR_LANGUAGE_CODES.get(locale) or locale.split("-", 1)[0].lower()
+
+
+async def _recognize_segment(
+    stt: Callable[[AsyncIterable[bytes]], Awaitable[str]],
+    segment: str,
+    slots: asyncio.Semaphore,
+) -> str:
+    """Run one segment through STT, holding one of the request's upload slots."""
+
+    async with slots:
+        return await stt(_Base64PcmStream(segment))
+
+
+async def _recognize_segments(
+    stt: Callable[[AsyncIterable[bytes]], Awaitable[str]], segments: list[str]
+) -> list[str]:
+    """Recognize all segments with bounded concurrency, in order.
+
+    If any segment fails (or the request is cancelled), the remaining uploads are
+    cancelled rather than left running, and billed, after the handler has returned.
+    """
+
+    slots = asyncio.Semaphore(_STT_SEGMENT_CONCURRENCY)
+    tasks = [
+        asyncio.ensure_future(_recognize_segment(stt, segment, slots)) for segment in segments
+    ]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+def _clean_base64(segment: str) -> str | None:
+    """Return the segment as unwrapped base64 ready for block decoding, or None if invalid.
+
+    Line-wrapped input (e.g. from base64.encodebytes) is accepted by dropping whitespace;
+    any other character outside the base64 alphabet, bad padding or an empty segment fails.
+    """
 
-    speech_key = os.getenv("AZURE_SPEECH_KEY") or os.getenv("AZURE_SPEECH_API_KEY")
-    speech_region = os.getenv("AZURE_SPEECH_REGION") or os.getenv("AZURE_SPEECH_LOCATION")
-    if not speech_key or not speech_region:
+    if not _BASE64_RE.fullmatch(segment):
+        segment = "".join(segment.split())
+        if not _BASE64_RE.fullmatch(segment):
+            return None
+    if not segment or len(segment) % 4:
+        return None
+    return segment
+
+
+def _audio_digest(audio_segments_b64: list[str]) -> bytes:
+    """Digest the base64 payload block by block, without materialising the decoded audio.
+
+    The response cache is shared by every caller of this anonymous endpoint, so a collision
+    would serve one client's audio to another. blake2b is keyed with a per-process secret,
+    making the digest a MAC: callers cannot craft colliding payloads without the key.
+    """
+
+    digest = hashlib.blake2b(digest_size=16, key=_AUDIO_DIGEST_KEY)
+    for segment in audio_segments_b64:
+        digest.update(len(segment).to_bytes(8, "little"))
+        for offset in range(0, len(segment), _B64_READ_CHUNK):
+            digest.update(segment[offset:offset + _B64_READ_CHUNK].encode("ascii"))
+    return digest.digest()
+
+
+class _Base64PcmStream:
+    """Request body that decodes base64 audio block by block, dropping a WAV header if present.
+
+    It is re-iterable so the shared client can replay it when a request is retried.
+    """
+
+    def __init__(self, audio_b64: str) -> None:
+        self._audio_b64 = audio_b64
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        audio_b64 = self._audio_b64
+        for offset in range(0, len(audio_b64), _B64_READ_CHUNK):
+            block = binascii.a2b_base64(audio_b64[offset:offset + _B64_READ_CHUNK])
+            if (
+                offset == 0
+                and len(block) > _WAV_HEADER_SIZE
+                and struct.unpack_from("<I", block)[0] == _RIFF_MAGIC_LE
+            ):
+                logger.debug("WAV header detected, stripping %d bytes", _WAV_HEADER_SIZE)
+                block = block[_WAV_HEADER_SIZE:]
+            if block:
+                yield block
+
+
+async def _translate_transcripts(
+    transcripts: list[str], source_locale: str, target_locale: str
+) -> list[str]:
+    """Translate transcripts, serving repeats from cache and batching the misses."""
+
+    translations = [
+        _cache_get(_TRANSLATION_CACHE, (source_locale, target_locale, text))
+        for text in transcripts
+    ]
+    misses = [i for i, translated in enumerate(translations) if translated is None]
+    if misses:
+        fresh = await translate_texts(
+            [transcripts[i] for i in misses], source_locale, target_locale
+        )
+        for i, translated in zip(misses, fresh):
+            translations[i] = translated
+            _cache_put(
+                _TRANSLATION_CACHE, (source_locale, target_locale, transcripts[i]), translated
+            )
+    return translations
+
+
+async def _post(url: str, **kwargs) -> httpx.Response:
+    """POST on the shared client, retrying throttling and transient server errors.
+
+    The transport already retries failed connects; this covers 429/5xx responses.
+    """
+
+    attempt = 0
+    while True:
+        response = await _HTTPX.post(url, **kwargs)
+        if response.status_code not in _RETRY_STATUSES or attempt >= _MAX_RETRIES:
+            return response
+        await asyncio.sleep(_RETRY_BACKOFF * 2**attempt)
+        attempt += 1
+
+
+def _require_speech_credentials() -> None:
+    if not _SPEECH_KEY or not _SPEECH_REGION:
         raise RuntimeError("Azure Speech credentials are not configured")
 
-    speech_config = speechsdk.SpeechConfig(
-        subscription=speech_key,
-        region=speech_region,
+
+@functools.lru_cache(maxsize=32)
+def _make_stt_caller(locale: str) -> Callable[[bytes | AsyncIterable[bytes]], Awaitable[str]]:
+    """Specialize (once per locale) a coroutine function that turns PCM audio into text.
+
+    The URL, query string and headers are fixed for the locale, so each call is just
+    the upload and the response parse.
+    """
+
+    _require_speech_credentials()
+    url = (
+        _STT_URL_TEMPLATE.format(region=_SPEECH_REGION)
+        + "?"
+        + urlencode({"language": locale, "format": "detailed"})
     )
-    speech_config.speech_recognition_language = locale
-    logging.info(
+    logger.debug(
         "Stage %s config: region=%s locale=%s",
         "speech_to_text",
-        speech_region,
+        _SPEECH_REGION,
         locale,
     )
 
-    # NEW: Define audio format explicitly (16kHz, 16-bit, mono PCM)
-    audio_format = speechsdk.audio.AudioStreamFormat(
-        samples_per_second=16000,
-        bits_per_sample=16,
-        channels=1
-    )
-
-    # NEW: Create push stream with format specification
-    audio_stream = speechsdk.audio.PushAudioInputStream(stream_format=audio_format)
-
-    # NEW: Strip WAV header (first 44 bytes) if present
-    if len(audio_bytes) > 44 and audio_bytes[:4] == b"RIFF":
-        logging.info("WAV header detected, stripping 44 bytes")
-        audio_bytes = audio_bytes[44:]
+    async def _stt(audio: bytes | AsyncIterable[bytes]) -> str:
+        try:
+            response = await _post(url, headers=_STT_HEADERS, content=audio, timeout=30)
+            if response.status_code != 200:
+                logger.error(
+                    "Speech API error: status=%s body=%s",
+                    response.status_code,
+                    response.text,
+                )
+            response.raise_for_status()
+        except httpx.HTTPError as exc:
+            logger.error("Speech recognition request failed: %s", str(exc))
+            raise
+
+        result = orjson.loads(response.content)
+        status = result.get("RecognitionStatus")
+        if status == "Success":
+            text = result.get("DisplayText")
+            if text is None and result.get("NBest"):
+                text = result["NBest"][0].get("Display")
+            if text is None:
+                raise RuntimeError(f"STT unexpected response: {result}")
+            return text
+        if status in ("NoMatch", "InitialSilenceTimeout", "BabbleTimeout"):
+            return ""
+        raise RuntimeError(f"STT failed: {status}")
+
+    return _stt
+
+
+async def speech_to_text(audio: bytes | AsyncIterable[bytes], locale: str) -> str:
+    """Convert headerless PCM audio to text via the Azure Speech short-audio REST API.
+
+    Returns an empty string when the audio contains no recognizable speech.
+
+    Bytes are sent with a Content-Length; iterables of blocks use chunked transfer,
+    which lets the service start recognizing before the upload completes.
+    """
 
-    audio_stream.write(audio_bytes)
-    audio_stream.close()
+    return await _make_stt_caller(locale)(audio)
 
-    audio_config = speechsdk.audio.AudioConfig(stream=audio_stream)
-    recognizer = speechsdk.SpeechRecognizer(
-        speech_config=speech_config,
-        audio_config=audio_config,
-    )
 
-    result = recognizer.recognize_once()
-    if result.reason == speechsdk.ResultReason.RecognizedSpeech:
-        return result.text
-    if result.reason == speechsdk.ResultReason.NoMatch:
-        raise RuntimeError("STT failed: No speech could be recognized")
-    if result.reason == speechsdk.ResultReason.Canceled:
-        cancellation = result.cancellation_details
-        raise RuntimeError(f"STT canceled: {cancellation.reason}, {cancellation.error_details}")
-    raise RuntimeError(f"STT failed: {result.reason}")
+def _batch_texts(texts: list[str]) -> Iterator[list[str]]:
+    """Split texts into batches that respect Translator's per-request item/char limits."""
 
+    batch: list[str] = []
+    batch_chars = 0
+    for text in texts:
+        if batch and (
+            len(batch) >= _TRANSLATOR_MAX_ITEMS
+            or batch_chars + len(text) > _TRANSLATOR_MAX_CHARS
+        ):
+            yield batch
+            batch = []
+            batch_chars = 0
+        batch.append(text)
+        batch_chars += len(text)
+    if batch:
+        yield batch
 
-def translate_text(text: str, source_locale: str, target_locale: str) -> str:
-    """Translate text using Azure Translator based on locale-derived language codes."""
 
-    def _extract_language_code(locale: str) -> str:
-        return locale.split("-", 1)[0] if locale else ""
+@functools.lru_cache(maxsize=64)
+def _translator_request(source_locale: str, target_locale: str) -> tuple[str, dict[str, str]]:
+    """Build (once per language pair) the Translator URL and headers; callers must not mutate."""
 
-    from_lang = _extract_language_code(source_locale)
-    to_lang = _extract_language_code(target_locale)
+    from_lang = _lang(source_locale) if source_locale else ""
+    to_lang = _lang(target_locale) if target_locale else ""
     if not from_lang or not to_lang:
         raise RuntimeError("Invalid locale provided for translation")
 
-    raw_endpoint = (
-        os.getenv("AZURE_TRANSLATE_ENDPOINT")
-        or os.getenv("AZURE_TRANSLATOR_ENDPOINT")
-        or os.getenv("AZURE_TRANSLATOR_URL")
-    )
-    endpoint = raw_endpoint.rstrip("/") if raw_endpoint else None
-    key = os.getenv("AZURE_TRANSLATE_KEY") or os.getenv("AZURE_TRANSLATOR_KEY")
-    region_value = (
-        os.getenv("AZURE_TRANSLATE_REGION")
-        or os.getenv("AZURE_TRANSLATOR_REGION")
-        or os.getenv("AZURE_TRANSLATOR_LOCATION")
-        or ""
-    ).strip()
-    if not endpoint or not key:
-        raise RuntimeError("Azure Translator credentials are not configured")
-
     path = f"/translate?api-version=3.0&from={from_lang}&to={to_lang}"
-    url = endpoint + path
+    return _TRANSLATOR_ENDPOINT + path, _TRANSLATOR_HEADERS
 
-    headers = {
-        "Ocp-Apim-Subscription-Key": key,
-        "Content-Type": "application/json",
-    }
 
-    if region_value:
-        headers["Ocp-Apim-Subscription-Region"] = region_value
+async def translate_texts(texts: list[str], source_locale: str, target_locale: str) -> list[str]:
+    """Translate several texts with as few Azure Translator requests as the API limits allow."""
 
-    body = [{"text": text}]
+    if not _TRANSLATOR_ENDPOINT or not _TRANSLATOR_KEY:
+        raise RuntimeError("Azure Translator credentials are not configured")
 
-    logging.info("Translating from %s to %s", from_lang, to_lang)
-    logging.info("URL: %s", url)
-    logging.info("Region header included: %s (%s)", bool(region_value), region_value or "None")
+    url, headers = _translator_request(source_locale, target_locale)
 
-    try:
-        response = requests.post(url, headers=headers, json=body, timeout=10)
-        if response.status_code != 200:
-            safe_headers = {
-                k: v for k, v in headers.items() if k != "Ocp-Apim-Subscription-Key"
-            }
-            logging.error(
-                "Translator API error: status=%s body=%s headers=%s",
-                response.status_code,
-                response.text,
-                safe_headers,
-            )
-        response.raise_for_status()
-    except requests.exceptions.RequestException as exc:
-        logging.error("Translation request failed: %s", str(exc))
-        raise
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Translating %d text(s) from %s to %s", len(texts), source_locale, target_locale
+        )
+        logger.debug("URL: %s", url)
+        logger.debug(
+            "Region header included: %s (%s)",
+            bool(_TRANSLATOR_REGION),
+            _TRANSLATOR_REGION or "None",
+        )
 
-    result = response.json()
-    try:
-        translated = result[0]["translations"][0]["text"]
-        logging.info("Translation successful: %s", translated)
-        return translated
-    except (KeyError, IndexError) as exc:
-        raise RuntimeError(f"Translator unexpected response: {result}") from exc
+    translations: list[str] = []
+    for batch in _batch_texts(texts):
+        body = [{"text": text} for text in batch]
+        try:
+            response = await _post(url, headers=headers, content=orjson.dumps(body))
+            if response.status_code != 200:
+                safe_headers = {
+                    k: v for k, v in headers.items() if k != "Ocp-Apim-Subscription-Key"
+                }
+                logger.error(
+                    "Translator API error: status=%s body=%s headers=%s",
+                    response.status_code,
+                    response.text,
+                    safe_headers,
+                )
+            response.raise_for_status()
+        except httpx.HTTPError as exc:
+            logger.error("Translation request failed: %s", str(exc))
+            raise
+
+        result = orjson.loads(response.content)
+        try:
+            if len(result) != len(batch):
+                raise IndexError("translation count mismatch")
+            translations.extend(item["translations"][0]["text"] for item in result)
+        except (KeyError, IndexError, TypeError) as exc:
+            raise RuntimeError(f"Translator unexpected response: {result}") from exc
+
+    logger.debug("Translation successful: %s", translations)
+    return translations
+
+
+async def translate_text(text: str, source_locale: str, target_locale: str) -> str:
+    """Translate text using Azure Translator based on locale-derived language codes."""
 
+    return (await translate_texts([text], source_locale, target_locale))[0]
 
-def text_to_speech(text: str, target_locale: str, neural_voice: str) -> bytes:
-    """Convert text to speech using Azure Speech Service with the provided neural voice name."""
 
-    speech_key = os.getenv("AZURE_SPEECH_KEY")
-    speech_region = os.getenv("AZURE_SPEECH_REGION")
-    if not speech_key or not speech_region:
-        raise RuntimeError("Azure Speech credentials are not configured")
+@functools.lru_cache(maxsize=32)
+def _make_tts_caller(target_locale: str, neural_voice: str) -> Callable[[str], Awaitable[bytes]]:
+    """Specialize (once per locale/voice) a coroutine function that turns text into WAV audio.
 
-    speech_config = speechsdk.SpeechConfig(
-        subscription=speech_key,
-        region=speech_region,
-    )
-    speech_config.speech_synthesis_voice_name = neural_voice
-    logging.info(
+    The URL and the SSML envelope around the text are built here, not per request.
+    """
+
+    _require_speech_credentials()
+    url = _TTS_URL_TEMPLATE.format(region=_SPEECH_REGION)
+    ssml_prefix = (
+        f"<speak version='1.0' xmlns='http://www.w3.org/2001/10/synthesis' "
+        f"xml:lang={quoteattr(target_locale)}>"
+        f"<voice name={quoteattr(neural_voice)}>"
+    ).encode("utf-8")
+    ssml_suffix = b"</voice></speak>"
+    logger.debug(
         "Stage %s config: region=%s locale=%s voice=%s",
         "text_to_speech",
-        speech_region,
+        _SPEECH_REGION,
         target_locale,
         neural_voice,
     )
 
-    synthesizer = speechsdk.SpeechSynthesizer(speech_config=speech_config, audio_config=None)
-    result = synthesizer.speak_text_async(text).get()
-
-    if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
-        return result.audio_data
-
-    if result.reason == speechsdk.ResultReason.Canceled:
-        cancellation = result.cancellation_details
-        raise RuntimeError(f"TTS canceled: {cancellation.reason}, {cancellation.error_details}")
-
-    raise RuntimeError(f"TTS failed: {result.reason}")
+    async def _tts(text: str) -> bytes:
+        ssml = ssml_prefix + escape(text).encode("utf-8") + ssml_suffix
+        try:
+            response = await _post(url, headers=_TTS_HEADERS, content=ssml)
+            if response.status_code != 200:
+                logger.error(
+                    "Speech synthesis API error: status=%s body=%s",
+                    response.status_code,
+                    response.text,
+                )
+            response.raise_for_status()
+        except httpx.HTTPError as exc:
+            logger.error("Speech synthesis request failed: %s", str(exc))
+            raise
+
+        if not response.content:
+            raise RuntimeError("TTS failed: empty audio response")
+        return response.content
+
+    return _tts
+
+
+async def text_to_speech(text: str, target_locale: str, neural_voice: str) -> bytes:
+    """Convert text to WAV speech via the Azure Speech synthesis REST API and a neural voice."""
+
+    return await _make_tts_caller(target_locale, neural_voice)(text)
+
+
+async def _warm_up() -> None:
+    """Open pooled connections to every upstream host before the first real request."""
+
+    probes = []
+    if _TRANSLATOR_ENDPOINT:
+        probes.append(f"{_TRANSLATOR_ENDPOINT}/languages?api-version=3.0")
+    if _SPEECH_REGION:
+        probes.append(_STT_URL_TEMPLATE.format(region=_SPEECH_REGION))
+        probes.append(_TTS_URL_TEMPLATE.format(region=_SPEECH_REGION))
+
+    for url in probes:
+        try:
+            # Any response is fine; the point is to leave a TLS connection in the pool
+            await _HTTPX.head(url, timeout=2)
+        except httpx.HTTPError as exc:
+            logger.debug("Warm-up request to %s failed: %s", url, exc)
+
+
+# The worker imports this module from its event loop, which also runs the handlers,
+# so warm the async client's pool there; outside a loop (e.g. tooling) skip it
+try:
+    _WARM_UP_TASK = asyncio.get_running_loop().create_task(_warm_up())
+except RuntimeError:
+    _WARM_UP_TASK = None